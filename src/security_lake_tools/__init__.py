@@ -3,4 +3,4 @@ Security Lake Tools - Utilities for managing AWS Security Lake custom sources.
 """
 
 __version__ = "0.1.2"
-__all__ = ["create_source"]
+__all__ = ["create_source", "status"]
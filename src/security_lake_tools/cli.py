@@ -5,6 +5,7 @@ import argparse
 import sys
 
 from .create_source import main as create_source_main
+from .status import main as status_main
 
 
 def main() -> int:
@@ -73,8 +74,37 @@ Examples:
         help="Do not automatically create the Glue role if it doesn't exist",
     )
 
+    # Status subcommand
+    status_parser = subparsers.add_parser(
+        "status",
+        help="Show the status of Security Lake in a region",
+        description="Show data lake configuration, exceptions, log sources, and subscribers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --region us-east-1
+  %(prog)s --region eu-west-1 --profile production
+        """,
+    )
+
+    status_parser.add_argument(
+        "--region", default="us-east-1", help="AWS region (default: us-east-1)"
+    )
+
+    status_parser.add_argument("--profile", help="AWS profile to use")
+
     args = parser.parse_args()
 
+    if args.command == "status":
+        # Pass the args directly to the status main function
+        sys.argv = ["security-lake-tools"]
+        if args.region != "us-east-1":
+            sys.argv.extend(["--region", args.region])
+        if args.profile:
+            sys.argv.extend(["--profile", args.profile])
+
+        return status_main()
+
     if args.command == "create-source":
         # Pass the args directly to the create_source main function
         # We need to make it look like it came from the original parser
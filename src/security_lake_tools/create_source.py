@@ -7,6 +7,7 @@ variable dependencies for better reproducibility and clarity.
 """
 
 import argparse
+import functools
 import json
 import sys
 import time
@@ -83,6 +84,19 @@ OCSF_EVENT_CLASSES: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=8)
+def _get_session(profile: str | None) -> boto3.Session:
+    """Get a boto3 session for the given profile, memoized per profile.
+
+    Credential and config resolution is non-trivial, so long-lived callers
+    that invoke the CLI entry points repeatedly reuse the same session. Tests
+    or callers that change credentials must call ``_get_session.cache_clear()``.
+    """
+    if profile:
+        return boto3.Session(profile_name=profile)
+    return boto3.Session()
+
+
 def get_current_account_id(session: boto3.Session) -> str | None:
     """Get the current AWS account ID."""
     try:
@@ -102,7 +116,7 @@ def verify_glue_role(session: boto3.Session, role_arn: str) -> bool:
     """Verify that the Glue IAM role exists."""
     try:
         iam = session.client("iam")
-        role_name = role_arn.split("/")[-1]
+        role_name = role_arn.rpartition("/")[2]
         iam.get_role(RoleName=role_name)
         return True
     except ClientError as e:
@@ -459,11 +473,7 @@ Examples:
         parser.error("--external-id is required")
 
     # Create boto3 session
-    session_kwargs = {}
-    if args.profile:
-        session_kwargs["profile_name"] = args.profile
-
-    session = boto3.Session(**session_kwargs)
+    session = _get_session(args.profile)
 
     # Auto-detect account ID if not provided
     account_id = args.account_id
@@ -484,7 +494,7 @@ Examples:
     if not args.skip_role_check:
         print(f"ℹ Checking Glue role: {glue_role_arn}")
         if not verify_glue_role(session, glue_role_arn):
-            role_name = glue_role_arn.split("/")[-1]
+            role_name = glue_role_arn.rpartition("/")[2]
 
             if args.no_create_role:
                 print(f"✗ Error: The Glue role does not exist: {glue_role_arn}")
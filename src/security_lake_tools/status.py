@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Show the status of Amazon Security Lake in a region.
+
+Reports the data lake configuration, recent data lake exceptions, configured
+log sources, and subscribers in a single overview.
+"""
+
+import argparse
+import itertools
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError, TokenRetrievalError
+except ImportError:
+    print("Error: boto3 is required. Install it with: pip install boto3")
+    sys.exit(1)
+
+if TYPE_CHECKING:
+    from mypy_boto3_securitylake import SecurityLakeClient
+
+from .create_source import _get_session
+
+# The four listings run concurrently against one client, so give the shared
+# connection pool headroom and let adaptive retries absorb throttling instead
+# of the default legacy mode.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=16,
+    retries={"mode": "adaptive", "max_attempts": 6},
+    tcp_keepalive=True,
+)
+
+# Only exceptions from the last week are considered recent enough to report.
+_EXCEPTION_WINDOW = timedelta(days=7)
+
+
+def _exception_cutoff() -> datetime:
+    """Compute the oldest timestamp still inside the reporting window."""
+    return datetime.now(UTC) - _EXCEPTION_WINDOW
+
+
+def preload(region: str) -> None:
+    """Warm the session and securitylake client caches for a region.
+
+    Building the first client loads the service JSON model and resolves the
+    endpoint and auth chain, which dominates cold-start latency. Long-lived
+    callers that invoke show_status repeatedly can call this once out-of-band
+    so the first real invocation skips that work.
+    """
+    _get_session(None).client("securitylake", region_name=region, config=_CLIENT_CONFIG)
+
+
+def get_data_lakes(client: "SecurityLakeClient") -> Sequence[Mapping[str, Any]] | None:
+    """Get the data lake configurations visible to the client's region."""
+    try:
+        response = client.list_data_lakes()
+        return response.get("dataLakes", [])
+    except ClientError:
+        return None
+
+
+def iter_data_lake_exceptions(client: "SecurityLakeClient") -> Iterator[Mapping[str, Any]]:
+    """Yield data lake exceptions within the reporting window, page by page.
+
+    Follows nextToken by hand; most accounts fit in one page, and skipping
+    botocore's paginator machinery avoids its per-page model lookup and token
+    resolution. Exceptions come back newest-first, so stop fetching as soon
+    as one falls behind the cutoff instead of walking the historical tail.
+    """
+    cutoff = _exception_cutoff()
+    token = None
+    while True:
+        if token:
+            response = client.list_data_lake_exceptions(nextToken=token)
+        else:
+            response = client.list_data_lake_exceptions()
+        for exc in response.get("exceptions", []):
+            timestamp = exc.get("timestamp")
+            if timestamp is not None and timestamp < cutoff:
+                return
+            yield exc
+        token = response.get("nextToken")
+        if not token:
+            break
+
+
+def iter_log_sources(client: "SecurityLakeClient") -> Iterator[Mapping[str, Any]]:
+    """Yield configured log sources page by page.
+
+    Follows nextToken by hand; most accounts fit in one page, and skipping
+    botocore's paginator machinery avoids its per-page model lookup and token
+    resolution.
+    """
+    token = None
+    while True:
+        if token:
+            response = client.list_log_sources(nextToken=token)
+        else:
+            response = client.list_log_sources()
+        yield from response.get("sources", [])
+        token = response.get("nextToken")
+        if not token:
+            break
+
+
+def iter_subscribers(client: "SecurityLakeClient") -> Iterator[Mapping[str, Any]]:
+    """Yield subscribers page by page.
+
+    Follows nextToken by hand; most accounts fit in one page, and skipping
+    botocore's paginator machinery avoids its per-page model lookup and token
+    resolution.
+    """
+    token = None
+    while True:
+        if token:
+            response = client.list_subscribers(nextToken=token)
+        else:
+            response = client.list_subscribers()
+        yield from response.get("subscribers", [])
+        token = response.get("nextToken")
+        if not token:
+            break
+
+
+def _prime(iterator: Iterator[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+    """Fetch the first item of an iterator so network errors surface here.
+
+    Lets the worker threads overlap the first round-trip of each listing and
+    report a ClientError through the future while the remaining pages stream
+    lazily to the printers.
+    """
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return itertools.chain((first,), iterator)
+
+
+def print_data_lakes(lakes: Sequence[Mapping[str, Any]]) -> None:
+    """Print the data lake configuration section."""
+    buf = ["Data lake:"]
+    if not lakes:
+        buf.append("  ℹ Security Lake is not enabled in this region")
+    for lake in lakes:
+        # Bind the method once per item; repeated lake.get(...) lookups pay
+        # attribute dispatch on every call.
+        get = lake.get
+        buf.append(f"  Region: {get('region', 'N/A')}")
+        buf.append(f"  Create status: {get('createStatus', 'N/A')}")
+        buf.append(f"  S3 bucket: {get('s3BucketArn', 'N/A')}")
+        encryption = get("encryptionConfiguration", {})
+        if encryption.get("kmsKeyId"):
+            buf.append(f"  KMS key: {encryption['kmsKeyId']}")
+        lifecycle = get("lifecycleConfiguration", {})
+        expiration = lifecycle.get("expiration", {})
+        if "days" in expiration:
+            buf.append(f"  Expiration: {expiration['days']} days")
+    buf.append("")
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
+def print_exceptions(exceptions: Iterable[Mapping[str, Any]]) -> None:
+    """Print data lake exceptions from the last 7 days."""
+    buf = ["Recent exceptions (last 7 days):"]
+    cutoff = _exception_cutoff()
+    for exc in exceptions:
+        timestamp = exc.get("timestamp")
+        # Exceptions arrive newest-first, so the first stale one ends the scan.
+        if timestamp is not None and timestamp < cutoff:
+            break
+        buf.append(f"  ✗ {exc.get('exception', 'N/A')}")
+        buf.append(f"    Region: {exc.get('region', 'N/A')}")
+        if timestamp is not None:
+            buf.append(f"    Timestamp: {timestamp}")
+        if exc.get("remediation"):
+            buf.append(f"    Remediation: {exc['remediation']}")
+    if len(buf) == 1:
+        buf.append("  ✔︎ No recent exceptions")
+    buf.append("")
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
+def print_log_sources(sources: Iterable[Mapping[str, Any]]) -> None:
+    """Print the configured log sources per account."""
+    buf = ["Log sources:"]
+    for entry in sources:
+        get = entry.get
+        account = get("account", "N/A")
+        region = get("region", "N/A")
+        buf.append(f"  Account {account} ({region}):")
+        for source in get("sources", []):
+            if "awsLogSource" in source:
+                aws_get = source["awsLogSource"].get
+                name = aws_get("sourceName", "N/A")
+                version = aws_get("sourceVersion", "N/A")
+                buf.append(f"    • {name} (AWS, version {version})")
+            elif "customLogSource" in source:
+                custom_get = source["customLogSource"].get
+                name = custom_get("sourceName", "N/A")
+                version = custom_get("sourceVersion", "N/A")
+                buf.append(f"    • {name} (custom, version {version})")
+                attrs = custom_get("attributes", {})
+                if "databaseArn" in attrs:
+                    db_name = attrs["databaseArn"].rpartition("/")[2]
+                    buf.append(f"      Database: {db_name}")
+                if "tableArn" in attrs:
+                    table_name = attrs["tableArn"].rpartition("/")[2]
+                    buf.append(f"      Table: {table_name}")
+    if len(buf) == 1:
+        buf.append("  ℹ No log sources configured")
+    buf.append("")
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
+def print_subscribers(subscribers: Iterable[Mapping[str, Any]]) -> None:
+    """Print the configured subscribers."""
+    buf = ["Subscribers:"]
+    for sub in subscribers:
+        get = sub.get
+        buf.append(f"  • {get('subscriberName', 'N/A')}")
+        buf.append(f"    ID: {get('subscriberId', 'N/A')}")
+        buf.append(f"    Status: {get('subscriberStatus', 'N/A')}")
+        access_types = get("accessTypes", [])
+        if access_types:
+            buf.append(f"    Access: {', '.join(access_types)}")
+        if get("subscriberEndpoint"):
+            buf.append(f"    Endpoint: {sub['subscriberEndpoint']}")
+        created = get("createdAt")
+        if created is not None:
+            buf.append(f"    Created: {created}")
+    if len(buf) == 1:
+        buf.append("  ℹ No subscribers configured")
+    buf.append("")
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
+def show_status(session: boto3.Session, region: str) -> int:
+    """Show the status of Security Lake in the given region."""
+    print(f"Security Lake status for region: {region}")
+    print()
+
+    # The four listings are independent network round-trips, so overlap them
+    # with a thread per call. Client construction is expensive (boto3 loads
+    # the service model and resolves endpoints/auth), and clients are
+    # thread-safe once built, so create a single client on the main thread
+    # and share it across the workers.
+    client = session.client("securitylake", region_name=region, config=_CLIENT_CONFIG)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        lakes_future = executor.submit(get_data_lakes, client)
+        exceptions_future = executor.submit(_prime, iter_data_lake_exceptions(client))
+        sources_future = executor.submit(_prime, iter_log_sources(client))
+        subscribers_future = executor.submit(_prime, iter_subscribers(client))
+
+    failed = False
+
+    lakes = lakes_future.result()
+    if lakes is None:
+        print("✗ Could not list data lakes")
+        failed = True
+    else:
+        print_data_lakes(lakes)
+
+    try:
+        print_exceptions(exceptions_future.result())
+    except ClientError:
+        print("✗ Could not list data lake exceptions")
+        failed = True
+
+    try:
+        print_log_sources(sources_future.result())
+    except ClientError:
+        print("✗ Could not list log sources")
+        failed = True
+
+    try:
+        print_subscribers(subscribers_future.result())
+    except ClientError:
+        print("✗ Could not list subscribers")
+        failed = True
+
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Show the status of Amazon Security Lake in a region",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --region us-east-1
+  %(prog)s --region eu-west-1 --profile production
+        """,
+    )
+
+    parser.add_argument("--region", default="us-east-1", help="AWS region (default: us-east-1)")
+
+    parser.add_argument("--profile", help="AWS profile to use")
+
+    args = parser.parse_args()
+
+    # Create boto3 session
+    session = _get_session(args.profile)
+
+    try:
+        return show_status(session, args.region)
+    except NoCredentialsError:
+        print("✗ Error: No AWS credentials found")
+        print("  Configure credentials using:")
+        print("  • aws configure")
+        print("  • Environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)")
+        print("  • IAM role (if running on EC2)")
+        return 1
+    except TokenRetrievalError:
+        print("✗ AWS SSO token has expired")
+        print("  Please refresh your SSO session:")
+        print("  aws sso login --profile <your-profile>")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""Tests for the status module."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from security_lake_tools.create_source import _get_session
+from security_lake_tools.status import (
+    _CLIENT_CONFIG,
+    get_data_lakes,
+    iter_data_lake_exceptions,
+    iter_log_sources,
+    iter_subscribers,
+    preload,
+    print_exceptions,
+    show_status,
+)
+
+
+class TestPreload:
+    """Test cache warming."""
+
+    def test_builds_client(self):
+        """Test that preload constructs a securitylake client."""
+        with patch("security_lake_tools.create_source.boto3.Session") as mock_session:
+            _get_session.cache_clear()
+            preload("us-east-1")
+
+            mock_session.return_value.client.assert_called_once_with(
+                "securitylake", region_name="us-east-1", config=_CLIENT_CONFIG
+            )
+        _get_session.cache_clear()
+
+
+class TestGetDataLakes:
+    """Test data lake listing."""
+
+    def test_returns_lakes(self):
+        """Test that data lakes are returned."""
+        client = Mock()
+        client.list_data_lakes.return_value = {"dataLakes": [{"region": "us-east-1"}]}
+
+        result = get_data_lakes(client)
+
+        assert result == [{"region": "us-east-1"}]
+
+    def test_client_error_returns_none(self):
+        """Test that a client error yields None."""
+        client = Mock()
+        client.list_data_lakes.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "ListDataLakes"
+        )
+
+        result = get_data_lakes(client)
+
+        assert result is None
+
+
+class TestIterDataLakeExceptions:
+    """Test data lake exception listing."""
+
+    def test_stops_at_cutoff(self):
+        """Test that fetching stops at the first exception past the cutoff."""
+        recent = {"exception": "recent", "timestamp": datetime.now(UTC)}
+        stale = {"exception": "stale", "timestamp": datetime.now(UTC) - timedelta(days=30)}
+        client = Mock()
+        client.list_data_lake_exceptions.return_value = {
+            "exceptions": [recent, stale],
+            "nextToken": "token",
+        }
+
+        result = list(iter_data_lake_exceptions(client))
+
+        assert result == [recent]
+        client.get_paginator.assert_not_called()
+
+
+class TestPrintExceptions:
+    """Test exception rendering."""
+
+    def test_stops_at_first_stale_exception(self, capsys):
+        """Test that printing stops at the first exception past the cutoff."""
+        recent = {"exception": "recent failure", "timestamp": datetime.now(UTC)}
+        stale = {
+            "exception": "stale failure",
+            "timestamp": datetime.now(UTC) - timedelta(days=30),
+        }
+
+        print_exceptions(iter([recent, stale]))
+
+        out = capsys.readouterr().out
+        assert "recent failure" in out
+        assert "stale failure" not in out
+
+
+class TestIterLogSources:
+    """Test log source listing."""
+
+    def test_single_page(self):
+        """Test that a tokenless response needs a single call."""
+        client = Mock()
+        client.list_log_sources.return_value = {"sources": [{"account": "111111111111"}]}
+
+        result = list(iter_log_sources(client))
+
+        assert result == [{"account": "111111111111"}]
+        client.list_log_sources.assert_called_once_with()
+
+    def test_follows_next_token(self):
+        """Test that a nextToken is followed until exhausted."""
+        client = Mock()
+        client.list_log_sources.side_effect = [
+            {"sources": [{"account": "111111111111"}], "nextToken": "token"},
+            {"sources": [{"account": "222222222222"}]},
+        ]
+
+        result = list(iter_log_sources(client))
+
+        assert result == [{"account": "111111111111"}, {"account": "222222222222"}]
+        client.list_log_sources.assert_called_with(nextToken="token")
+
+
+class TestIterSubscribers:
+    """Test subscriber listing."""
+
+    def test_client_error_propagates(self):
+        """Test that a client error propagates to the consumer."""
+        client = Mock()
+        client.list_subscribers.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "ListSubscribers"
+        )
+
+        with pytest.raises(ClientError):
+            list(iter_subscribers(client))
+
+
+class TestShowStatus:
+    """Test the status report orchestration."""
+
+    def _make_client(self):
+        client = Mock()
+        client.list_data_lakes.return_value = {"dataLakes": []}
+        client.list_data_lake_exceptions.return_value = {"exceptions": []}
+        client.list_log_sources.return_value = {"sources": []}
+        client.list_subscribers.return_value = {"subscribers": []}
+        return client
+
+    def test_success(self):
+        """Test a successful status report."""
+        session = Mock()
+        session.client.return_value = self._make_client()
+
+        result = show_status(session, "us-east-1")
+
+        assert result == 0
+
+    def test_reports_failure(self):
+        """Test that a failing section is reported as an error."""
+        client = self._make_client()
+        client.list_data_lakes.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "ListDataLakes"
+        )
+        session = Mock()
+        session.client.return_value = client
+
+        result = show_status(session, "us-east-1")
+
+        assert result == 1